@@ -524,7 +524,7 @@ class MainWindow(QMainWindow):
                 )
         for layout_name in [action.text() for action in self.layouts_menu.actions()]:
             if (
-                layout_name not in self.project_settings.layouts.keys()
+                layout_name not in self.project_settings.layouts
                 and layout_name != "New Layout"
                 and layout_name != "Delete Layout"
                 and layout_name != ""
@@ -559,7 +559,7 @@ class MainWindow(QMainWindow):
         if (
             layout_name is None
             or layout_name == ""
-            or layout_name in [name for name in self.project_settings.layouts.keys()]
+            or layout_name in self.project_settings.layouts
         ):
             # msg box to error
             msg = QtWidgets.QMessageBox()
@@ -649,7 +649,7 @@ class MainWindow(QMainWindow):
         self.delete_layout(layout_name)
 
     def delete_layout(self, layout_name: str):
-        if layout_name not in self.project_settings.layouts.keys():
+        if layout_name not in self.project_settings.layouts:
             self.update_status(f"Layout {layout_name} not found", logging.WARN)
             return
 
@@ -1589,7 +1589,7 @@ def ScaleDistance(video_dict, df=None, column=None):
 
     """
 
-    if "scale" not in video_dict.keys():
+    if "scale" not in video_dict:
         return df
 
     if video_dict["scale"]["px_distance"] != None:
@@ -1475,7 +1475,7 @@ def read_block(
                 if len(block_notes) > 0:
                     for temp in block_notes:
                         if temp.StoreName == store_code["name"]:
-                            if "Enabled" in temp.keys():
+                            if "Enabled" in temp:
                                 if temp.Enabled == "2":
                                     warnings.warn(
                                         "{0} store DISABLED".format(temp.StoreName),
@@ -1541,7 +1541,7 @@ def read_block(
                     continue
 
                 # add store information to store map
-                if not var_name in header.stores.keys():
+                if var_name not in header.stores:
                     if store_code["type_str"] != "epocs":
                         header.stores[var_name] = tdt.StructType(
                             name=store_code["name"],
@@ -1618,7 +1618,7 @@ def read_block(
                     header.stores[var_name].chan.append(temp[::2])
 
                     if store_code["type_str"] == "snips":
-                        if "sortcode" not in header.stores[var_name].keys():
+                        if "sortcode" not in header.stores[var_name]:
                             header.stores[var_name].sortcode = []
                         if len(custom_sort_codes) > 0 and var_name in custom_sort_event:
                             # apply custom sort codes
@@ -1720,7 +1720,7 @@ def read_block(
         for ii in range(len(epocs.name)):
             if epocs.type[ii] == "offset":
                 var_name = tdt.fix_var_name(epocs.buddies[ii])
-                if var_name not in header.stores.keys():
+                if var_name not in header.stores:
                     warnings.warn(
                         epocs.buddies[ii] + " buddy epoc not found, skipping", Warning
                     )
@@ -1729,7 +1729,7 @@ def read_block(
                 header.stores[var_name].offset = epocs.ts[ii]
 
                 # handle odd case where there is a single offset event and no onset events
-                if "onset" not in header.stores[var_name].keys():
+                if "onset" not in header.stores[var_name]:
                     header.stores[var_name].name = epocs.buddies[ii]
                     header.stores[var_name].onset = 0
                     header.stores[var_name].type_str = "epocs"
@@ -1765,7 +1765,7 @@ def read_block(
                             head_name = storeNote["HeadName"]
                             if "|" in head_name:
                                 primary = tdt.fix_var_name(head_name[-4:])
-                                if primary in header.stores.keys():
+                                if primary in header.stores:
                                     header.stores[var_name].offset = header.stores[
                                         primary
                                     ].offset
@@ -1777,25 +1777,25 @@ def read_block(
         for var_name in keys:
             if header.stores[var_name].type_str == "snips":
                 if "snips" in evtype and sortname != "TankSort":
-                    if "sortcode" not in header.stores[var_name].keys():
+                    if "sortcode" not in header.stores[var_name]:
                         header.stores.pop(var_name)
 
         for var_name in header.stores.keys():
 
             # convert cell arrays to regular arrays
-            if "ts" in header.stores[var_name].keys():
+            if "ts" in header.stores[var_name]:
                 header.stores[var_name].ts = np.concatenate(
                     header.stores[var_name].ts, axis=1
                 )[0]
-            if "chan" in header.stores[var_name].keys():
+            if "chan" in header.stores[var_name]:
                 header.stores[var_name].chan = np.concatenate(
                     header.stores[var_name].chan
                 )
-            if "sortcode" in header.stores[var_name].keys():
+            if "sortcode" in header.stores[var_name]:
                 header.stores[var_name].sortcode = np.concatenate(
                     header.stores[var_name].sortcode
                 )
-            if "data" in header.stores[var_name].keys():
+            if "data" in header.stores[var_name]:
                 if header.stores[var_name].type_str != "epocs":
                     header.stores[var_name].data = np.concatenate(
                         header.stores[var_name].data, axis=1
@@ -1803,11 +1803,11 @@ def read_block(
 
             # if it's a data type, cast as a file offset pointer instead of data
             if header.stores[var_name].type_str in ["streams", "snips"]:
-                if "data" in header.stores[var_name].keys():
+                if "data" in header.stores[var_name]:
                     header.stores[var_name].data = header.stores[var_name].data.view(
                         np.uint64
                     )
-            if "chan" in header.stores[var_name].keys():
+            if "chan" in header.stores[var_name]:
                 if np.max(header.stores[var_name].chan) == 1:
                     header.stores[var_name].chan = [1]
         del heads  # don't need this anymore
@@ -1848,7 +1848,7 @@ def read_block(
         firstStart = valid_time_range[0, 0]
         last_stop = valid_time_range[1, -1]
 
-        if "ts" in header.stores[var_name].keys():
+        if "ts" in header.stores[var_name]:
             if current_type_str == "streams":
                 data[current_type_str][var_name].start_time = [
                     0 for jj in range(num_ranges)
@@ -2342,11 +2342,10 @@ def read_block(
                     )
                     continue
 
-                data[current_type_str][current_name].data = [
-                    [] for i in range(num_ranges)
-                ]
+                store = data[current_type_str][current_name]
+                store.data = [[] for i in range(num_ranges)]
                 for jj in range(num_ranges):
-                    fc = data[current_type_str][current_name].filtered_chan[jj]
+                    fc = store.filtered_chan[jj]
                     if len(fc) < 1:
                         continue
 
@@ -2361,9 +2360,7 @@ def read_block(
 
                     if len(fc) == 1:
                         # there is only one channel here, use them all
-                        valid_ind = np.arange(
-                            len(data[current_type_str][current_name].filtered_data[jj])
-                        )
+                        valid_ind = np.arange(len(store.filtered_data[jj]))
                         nchan = np.uint64(1)
                     elif len(channels) == 1:
                         valid_ind = fc == channels[0]
@@ -2382,17 +2379,18 @@ def read_block(
                         nchan = np.uint64(len(list(set(fc))))
 
                     chan_index = np.zeros(nchan, dtype=np.uint64)
-                    these_offsets = data[current_type_str][current_name].filtered_data[
-                        jj
-                    ][valid_ind]
+                    these_offsets = store.filtered_data[jj][valid_ind]
 
                     # preallocate data array
                     npts = (current_size - np.uint32(10)) * np.uint32(4) // sz
                     # size_in_bytes = current_data_format(1).itemsize * nchan * npts * np.uint64(len(these_offsets)) // nchan
-                    data[current_type_str][current_name].data[jj] = np.zeros(
+                    # every slot is either gathered from the tev or zeroed on
+                    # the skip path below, so there is no need to memset here
+                    jj_data = np.empty(
                         [nchan, npts * np.uint64(len(these_offsets)) // nchan],
                         dtype=current_data_format,
                     )
+                    store.data[jj] = jj_data
 
                     max_read_size = 10000000
                     iter = max(min(8192, len(these_offsets) - 1), 1)
@@ -2432,10 +2430,13 @@ def read_block(
                         xxx = these_offsets[start:stop]
 
                         # convert offsets from bytes to indices in data array
-                        relative_offsets = ((xxx - min(xxx)) / sz)[np.newaxis].T
-                        ind = relative_offsets + np.tile(
-                            range(npts), [len(relative_offsets), 1]
+                        relative_offsets = (
+                            ((xxx - min(xxx)) // sz).astype(np.int64)[np.newaxis].T
                         )
+                        ind = relative_offsets + np.arange(npts, dtype=np.int64)
+                        # rows are increasing, so the last index decides whether
+                        # the whole row is inside the buffer we just read
+                        row_valid = ind[:, -1] < len(tev_data)
 
                         # loop through values, filling array
                         found_empty = False
@@ -2445,14 +2446,13 @@ def read_block(
                             else:
                                 arr_index = 0
                             channel_offset += 1
-                            if not np.any(ind[kk, :] <= len(tev_data)):
+                            ci = chan_index[arr_index]
+                            if not row_valid[kk]:
+                                jj_data[arr_index, ci : ci + npts] = 0
                                 chan_index[arr_index] += npts
                                 continue
                             found_empty = False
-                            data[current_type_str][current_name].data[jj][
-                                arr_index,
-                                chan_index[arr_index] : (chan_index[arr_index] + npts),
-                            ] = tev_data[ind[kk, :].flatten().astype(np.uint64)]
+                            jj_data[arr_index, ci : ci + npts] = tev_data[ind[kk]]
                             chan_index[arr_index] += npts
                     else:
                         # add data to big cell array
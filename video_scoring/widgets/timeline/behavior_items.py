@@ -1,6 +1,6 @@
 from typing import TYPE_CHECKING
 
-from qtpy.QtCore import QObject, QPointF, QRectF, Qt, QTimer, Signal
+from qtpy.QtCore import QRectF, Qt, QTimer
 from qtpy.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPen
 from qtpy.QtWidgets import (QGraphicsItem, QGraphicsRectItem,
                             QGraphicsSceneHoverEvent, QGraphicsSceneMouseEvent,
@@ -10,14 +10,13 @@ from video_scoring.widgets.timeline.commands import OnsetOffsetMoveCommand
 
 if TYPE_CHECKING:
     from qtpy.QtCore import QPointF
+    from qtpy.QtGui import QAction
 
     from video_scoring import MainWindow
     from video_scoring.widgets.timeline.timeline import TimelineView
     from video_scoring.widgets.timeline.track import BehaviorTrack
 
-
-class OnsetOffsetItemSignals(QObject):
-    unhighlight_sig = Signal()
+_SURE_LABEL = ("Sure", "Unsure")
 
 
 class OnsetOffsetItem(QGraphicsRectItem):
@@ -27,6 +26,13 @@ class OnsetOffsetItem(QGraphicsRectItem):
     Grabbing the middle will move the whole thing
     """
 
+    # pens and brushes that don't depend on the track color, shared by all items
+    _no_pen = QPen(Qt.PenStyle.NoPen)
+    _select_pen = QPen(Qt.GlobalColor.lightGray, 2)
+    _hover_pen = QPen(Qt.GlobalColor.lightGray, 3)
+    _unsure_pen = QPen(Qt.GlobalColor.yellow, 3)
+    _error_brush = QBrush(QColor("#ff0000"))
+
     def __init__(
         self,
         onset: int,
@@ -38,15 +44,18 @@ class OnsetOffsetItem(QGraphicsRectItem):
         super().__init__(parent)
         self.parent = parent
         self.view = view
+        # cached so the drag and release paths don't walk the parent chain each time
+        self._main_window: "MainWindow" = view.main_window
 
         # DO NOT MODIFY THESE DIRECTLY
         self._onset: int = onset
         self._offset: int = offset
         self.unsure: bool = unsure
 
-        self.signals = OnsetOffsetItemSignals()
         self.pressed = False
         self.last_mouse_pos = None
+        self._press_onset = onset
+        self._press_offset = offset
         self.left_edge_grabbed = False
         self.right_edge_grabbed = False
         self.hovered = False
@@ -54,19 +63,25 @@ class OnsetOffsetItem(QGraphicsRectItem):
         self.hover_right_edge = False
         self.edge_grab_boundary = 8
         self.extend_edge_grab_boundary = 8
+        # total width of each edge's grab zone, used for hit-testing on every hover
+        self._edge_grab_width = self.edge_grab_boundary + self.extend_edge_grab_boundary
+        # scene area dirtied by drags, flushed at most once per event loop turn
+        self._dirty_rect = QRectF()
+        self._repaint_pending = False
+        # timestamps dock updates, flushed at most once per event loop turn
+        self._timestamps_update_pending = False
+        self._timestamps_refresh_needed = False
+        # both built on the first get_context_menu call
+        self._context_menu: QMenu | None = None
+        self._unsure_action: QAction | None = None
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, True)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
         self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)
-        self.signals.unhighlight_sig.connect(self.unhighlight)
         # set geometry
-        self.base_color = QColor(self.parent.item_color)
-        self.setBrush(QBrush(self.base_color))
-        self.highlight_color = self.base_color.lighter(110)
-        self.setToolTip(
-            f"{self.onset} - {self.offset} - {['Sure', 'Unsure'][self.unsure]}"
-        )
+        base_color = QColor(self.parent.item_color)
+        self.set_colors(base_color, base_color.lighter(110))
+        self._tooltip_dirty = True
 
     # TODO: is there a reason we don't use the built in setters/getters? Fix this if not
     @property
@@ -92,129 +107,116 @@ class OnsetOffsetItem(QGraphicsRectItem):
         event : QMouseEvent
             The mouse event that triggered the context menu
         """
-        menu = QMenu()
-        if self.unsure:
-            unsure_action = menu.addAction("Set Sure")
-            unsure_action.triggered.connect(lambda: self.parent.set_unsure(self, False))
-            unsure_action.triggered.connect(menu.close)
-        else:
-            unsure_action = menu.addAction("Set Unsure")
-            unsure_action.triggered.connect(lambda: self.parent.set_unsure(self, True))
-            unsure_action.triggered.connect(menu.close)
-        delete_action = menu.addAction("Delete")
-        delete_action.triggered.connect(
-            lambda: self.view.delete_oo_behavior(onset=self.onset, track=self.parent)
-        )
-        return menu
+        # built on first use and reused, only the sure/unsure label changes
+        if self._context_menu is None:
+            menu = QMenu()
+            self._unsure_action = menu.addAction("Set Unsure")
+            self._unsure_action.triggered.connect(
+                lambda: self.parent.set_unsure(self, not self.unsure)
+            )
+            delete_action = menu.addAction("Delete")
+            delete_action.triggered.connect(
+                lambda: self.view.delete_oo_behavior(
+                    onset=self.onset, track=self.parent
+                )
+            )
+            self._context_menu = menu
+        self._unsure_action.setText("Set Sure" if self.unsure else "Set Unsure")
+        return self._context_menu
+
+    def set_colors(self, base_color: QColor, highlight_color: QColor):
+        """
+        Set the fill colors of the behavior item and rebuild the cached brushes.
+
+        Parameters
+        ----------
+        base_color : QColor
+            The fill color
+        highlight_color : QColor
+            The fill color while hovered
+        """
+        self.base_color = base_color
+        self.highlight_color = highlight_color
+        self.update_brushes()
+        self.setBrush(self._highlight_brush if self.hovered else self._base_brush)
+
+    def update_brushes(self):
+        """
+        Rebuild the cached brushes and pens from `base_color` and `highlight_color`.
+        Call this whenever either color changes.
+        """
+        self._base_brush = QBrush(self.base_color)
+        self._highlight_brush = QBrush(self.highlight_color)
+        self._edge_color = self.highlight_color.lighter(150)
+        self._edge_brush = QBrush(self._edge_color)
+        self._edge_pen = QPen(self._edge_color, 3)
 
     def update_tooltip(self):
-        self.setToolTip(
-            f"{self.onset} - {self.offset} - {['Sure', 'Unsure'][self.unsure]}"
-        )
+        # the tooltip is only seen when hovering, so defer building it until then
+        self._tooltip_dirty = True
+
+    def _refresh_tooltip(self):
+        if self._tooltip_dirty:
+            self._tooltip_dirty = False
+            self.setToolTip(
+                f"{self._onset} - {self._offset} - {_SURE_LABEL[self.unsure]}"
+            )
 
     def _drag_left_edge(self, event: QGraphicsSceneMouseEvent) -> None:
-        scene_x: QPointF = self.mapToScene(
-            QPointF(event.pos()) - self.last_mouse_pos
-        ).x()
-        nearest_frame = self.view.get_frame_of_x_pos(scene_x)
+        r = self.rect()
+        scene_x = event.scenePos().x() - self.last_mouse_pos.x()
         # Ensure the onset is not before the beginning of the video
         if scene_x < 0:
             return
+        snapped_x, n_onset = self.view.snap_scene_x(scene_x)
 
         # Ensure onset frame does not exceed offset frame
-        if nearest_frame >= self.offset:
+        if n_onset >= self.offset:
             return
         # Get the x position of the nearest frame in local coordinates (by subtracting the current x position)
-        snapped_x_local = (
-            round(scene_x / self.view.frame_width) * self.view.frame_width
-        ) - self.pos().x()
-        new_width = self.rect().right() - snapped_x_local  # Calculate the new width
-
-        # save the old position
-        old_x_local = self.rect().left()
-        old_width = self.rect().width()
-
-        # Set the new position and size of the rectangle, and update the n_onset frame
-        self.setRect(
-            snapped_x_local, self.rect().top(), new_width, self.rect().height()
-        )
-        n_onset = self.view.get_frame_of_x_pos(
-            self.mapToScene(self.rect().left(), 0).x()
-        )
+        snapped_x_local = snapped_x - self.scenePos().x()
+        new_width = r.right() - snapped_x_local  # Calculate the new width
 
-        # if we overlap with another item, revert the change
+        # if we'd overlap with another item, leave the rect alone so nothing repaints
         if self.parent.overlap_with_item_check(self, onset=n_onset):
-            self.setRect(
-                old_x_local, self.rect().top(), old_width, self.rect().height()
-            )
-        # otherwise, update the behavior
-        else:
-            self.set_onset(new_onset=n_onset)
-        self.update()
+            return
+        # otherwise, set the new position and size of the rectangle and update the behavior
+        self.setRect(snapped_x_local, r.top(), new_width, r.height())
+        self.set_onset(new_onset=n_onset)
 
     def _drag_right_edge(self, event: QGraphicsSceneMouseEvent) -> None:
-        new_width = (
-            round(
-                # get the x position of the mouse in the scene, but don't let it exceed the right edge of the scene
-                min(
-                    self.mapToScene(QPointF(event.pos())).x(),
-                    self.view.sceneRect().right(),
-                )
-                # Snap the x position to the nearest frame by dividing by the frame width,
-                # rounding to the nearest frame, then multiplying by the frame width
-                / self.view.frame_width
-            )
-            * self.view.frame_width
-            # subtract the current x position to convert to local x position
-            - self.pos().x()
+        r = self.rect()
+        # get the x position of the mouse in the scene, but don't let it exceed the
+        # right edge of the scene, and snap it to the nearest frame
+        snapped_x, n_offset = self.view.snap_scene_x(
+            min(event.scenePos().x(), self.view.sceneRect().right())
         )
-
-        # Finally, subtract the left edge of the rectangle to get the new width in local coordinates
-        -self.rect().left()
+        # subtract the current x position to convert to local x position, then the
+        # left edge of the rectangle to get the new width in local coordinates
+        new_width = snapped_x - self.scenePos().x() - r.left()
 
         if new_width < 1:
             return
 
-        old_width = self.rect().width()
-
-        self.setRect(
-            self.rect().left(), self.rect().top(), new_width, self.rect().height()
-        )
-        n_offset = int(
-            round(self.mapToScene(QPointF(event.pos())).x() / self.view.frame_width)
-        )
-
         if self.parent.overlap_with_item_check(self, offset=n_offset):
-            self.setRect(
-                self.rect().left(), self.rect().top(), old_width, self.rect().height()
-            )
-        else:
-            self.set_offset(new_offset=n_offset)
-        self.update()
+            return
+        self.setRect(r.left(), r.top(), new_width, r.height())
+        self.set_offset(new_offset=n_offset)
 
     def _drag_item(self, event: QGraphicsSceneMouseEvent) -> None:
-        scene_x: QPointF = self.mapToScene(
-            QPointF(event.pos()) - self.last_mouse_pos
-        ).x()
-        new_x = self.view.get_x_pos_of_frame(self.view.get_frame_of_x_pos(scene_x))
+        scene_x = event.scenePos().x() - self.last_mouse_pos.x()
+        new_x, _ = self.view.snap_scene_x(scene_x)
 
         if new_x < 0:
             new_x = 0
 
-        old_x = self.pos().x()
-
-        self.setPos(new_x, self.pos().y())
-        n_onset = self.view.get_frame_of_x_pos(
-            self.mapToScene(self.rect().left(), 0).x()
-        )
-        n_offset = self.view.get_frame_of_x_pos(
-            self.mapToScene(self.rect().right(), 0).x()
-        )
+        r = self.rect()
+        n_onset = self.view.get_frame_of_x_pos(new_x + r.left())
+        n_offset = self.view.get_frame_of_x_pos(new_x + r.right())
         if self.parent.overlap_with_item_check(self, onset=n_onset, offset=n_offset):
-            self.setPos(old_x, self.pos().y())
-        else:
-            self.set_onset(new_onset=n_onset)
-            self.set_offset(new_offset=n_offset)
+            return
+        self.setPos(new_x, self.pos().y())
+        self.set_onset_offset_fast(n_onset, n_offset)
 
     def set_onset(self, new_onset: int):
         """
@@ -225,9 +227,11 @@ class OnsetOffsetItem(QGraphicsRectItem):
         new_onset : int
             The new onset value
         """
+        if new_onset == self._onset:
+            return
         self.parent.update_behavior_onset(self, new_onset)
         self._onset = new_onset
-        self.view.main_window.timestamps_dw.refresh()
+        self._schedule_timestamps_update(refresh=True)
         self.update_tooltip()
 
     def set_offset(self, new_offset: int):
@@ -239,10 +243,10 @@ class OnsetOffsetItem(QGraphicsRectItem):
         new_offset : int
             The new offset value
         """
-        if new_offset < self.onset + 1:
+        if new_offset == self._offset or new_offset < self.onset + 1:
             return
         self._offset = new_offset
-        self.view.main_window.timestamps_dw.update()
+        self._schedule_timestamps_update()
         self.update_tooltip()
 
     def set_onset_offset(self, new_onset: int, new_offset: int):
@@ -259,6 +263,29 @@ class OnsetOffsetItem(QGraphicsRectItem):
         self.set_onset(new_onset)
         self.set_offset(new_offset)
 
+    def set_onset_offset_fast(self, new_onset: int, new_offset: int):
+        """
+        Set the onset and offset of the behavior item while dragging. The parent track
+        is synced once and the timestamps dock update is coalesced like the other
+        setters.
+
+        Parameters
+        ----------
+        new_onset : int
+            The new onset value
+        new_offset : int
+            The new offset value
+        """
+        if new_onset == self._onset and new_offset == self._offset:
+            return
+        onset_changed = new_onset != self._onset
+        if onset_changed:
+            self.parent.update_behavior_onset(self, new_onset)
+            self._onset = new_onset
+        self._offset = new_offset
+        self._schedule_timestamps_update(refresh=onset_changed)
+        self.update_tooltip()
+
     def set_unsure(self, unsure: bool):
         """
         Set the unsure status of the behavior item.
@@ -273,159 +300,170 @@ class OnsetOffsetItem(QGraphicsRectItem):
         self.update()
 
     def highlight(self):
-        self.setBrush(QBrush(self.highlight_color))
+        self.setBrush(self._highlight_brush)
 
     def unhighlight(self):
-        self.setBrush(QBrush(self.base_color))
+        self.setBrush(self._base_brush)
 
     def errorHighlight(self):
-        self.setBrush(QBrush(QColor("#ff0000")))
+        self.setBrush(self._error_brush)
 
     def setErrored(self):
         # will set the error highlight for a short time
         self.errorHighlight()
         QTimer.singleShot(300, self.unhighlight)
 
+    def _schedule_timestamps_update(self, refresh: bool = False):
+        # a refresh also rebuilds the dock's track list, an update only its table
+        self._timestamps_refresh_needed = self._timestamps_refresh_needed or refresh
+        if not self._timestamps_update_pending:
+            self._timestamps_update_pending = True
+            QTimer.singleShot(0, self._flush_timestamps_update)
+
+    def _flush_timestamps_update(self):
+        self._timestamps_update_pending = False
+        timestamps_dw = self._main_window.timestamps_dw
+        if self._timestamps_refresh_needed:
+            timestamps_dw.refresh()
+        else:
+            timestamps_dw.update()
+        self._timestamps_refresh_needed = False
+
+    def _edge_under(self, x: float) -> int:
+        """
+        Returns which edge the local x position is over: -1 for the left edge, 1 for
+        the right edge and 0 for the middle of the item.
+        """
+        w = self.rect().width()
+        # if we're smaller than 10 pixels, the closest edge wins
+        if w < 10:
+            return -1 if x <= w * 0.5 else 1
+        b = self._edge_grab_width
+        # when both grab zones overlap (narrow items) the shared middle moves the item
+        return (x >= w - b) - (x <= b)
+
+    def _update_cache_mode(self):
+        # hovered/pressed items repaint on nearly every event, so the device cache
+        # would be invalidated and re-rasterized each time. only cache idle items.
+        if self.hovered or self.pressed:
+            mode = QGraphicsItem.CacheMode.NoCache
+        else:
+            mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+        if self.cacheMode() != mode:
+            self.setCacheMode(mode)
+
     def mousePressEvent(self, event):
         # Handle mouse press events
         self.pressed = True
+        self._update_cache_mode()
+        # while dragging, be on top of everything except the playhead
+        self.setZValue(999)
         self.setSelected(True)
         self.last_mouse_pos = event.pos()
-        cur_onset = self.onset
-        cur_offset = self.offset
-        self.cur_move_command = OnsetOffsetMoveCommand(
-            cur_onset, cur_offset, cur_onset, cur_offset, self
+        # the move command is only built on release, and only if we actually moved
+        self._press_onset = self._onset
+        self._press_offset = self._offset
+        prev_state = (
+            self.left_edge_grabbed,
+            self.right_edge_grabbed,
+            self.hover_left_edge,
+            self.hover_right_edge,
         )
-        # if its we're smaller than 10 pixels, determine which edge we're closest to by dividing the width by 2
-        if self.rect().width() < 10:
-            if event.pos().x() <= self.rect().width() / 2:
-                self.left_edge_grabbed = True
-                self.hover_left_edge = True
-                self.right_edge_grabbed = False
-                self.hover_right_edge = False
-                self.update()
-            else:
-                self.left_edge_grabbed = False
-                self.hover_left_edge = False
-                self.right_edge_grabbed = True
-                self.hover_right_edge = True
-                self.update()
-        elif (
-            event.pos().x() <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-            and not event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-        ):
-            self.left_edge_grabbed = True
-            self.hover_left_edge = True
-            self.right_edge_grabbed = False
-            self.hover_right_edge = False
-            self.update()
-        elif (
-            event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-            and not event.pos().x()
-            <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-        ):
-            self.left_edge_grabbed = False
-            self.hover_left_edge = False
-            self.right_edge_grabbed = True
-            self.hover_right_edge = True
-            self.update()
-        else:
-            self.left_edge_grabbed = False
-            self.hover_left_edge = False
-            self.right_edge_grabbed = False
-            self.hover_right_edge = False
+        edge = self._edge_under(event.pos().x())
+        left, right = edge == -1, edge == 1
+        self.left_edge_grabbed = self.hover_left_edge = left
+        self.right_edge_grabbed = self.hover_right_edge = right
+        if (left, right, left, right) != prev_state:
             self.update()
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         self.pressed = False
-        if (
-            self.cur_move_command.undo_onset != self.onset
-            or self.cur_move_command.undo_offset != self.offset
-        ):
-            self.cur_move_command.redo_onset = self.onset
-            self.cur_move_command.redo_offset = self.offset
-            self.parent.parent.parent.main_win.command_stack.add_command(
-                self.cur_move_command
+        self._update_cache_mode()
+        self.setZValue(10)
+        self._refresh_tooltip()
+        if self._press_onset != self._onset or self._press_offset != self._offset:
+            self._main_window.command_stack.add_command(
+                OnsetOffsetMoveCommand(
+                    self._press_onset,
+                    self._press_offset,
+                    self._onset,
+                    self._offset,
+                    self,
+                )
             )
         super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event):
+        old_rect = self.sceneBoundingRect()
         if self.pressed:
-            # set our z value to be on top of everything except the playhead
-            self.setZValue(999)
             if self.left_edge_grabbed:
                 self._drag_left_edge(event)
             elif self.right_edge_grabbed:
                 self._drag_right_edge(event)
             else:
                 self._drag_item(event)
-
-        self.setZValue(10)
-        self.scene().update()
+        new_rect = self.sceneBoundingRect()
+        # only the strip we moved across needs repainting, and nothing if we didn't move
+        if new_rect != old_rect:
+            self._schedule_repaint(old_rect.united(new_rect))
+
+    def _schedule_repaint(self, rect: QRectF):
+        # the outline pens are wider than the item's own pen, pad so they're repainted
+        self._dirty_rect = self._dirty_rect.united(rect.adjusted(-2, -2, 2, 2))
+        if not self._repaint_pending:
+            self._repaint_pending = True
+            QTimer.singleShot(0, self._flush_repaint)
+
+    def _flush_repaint(self):
+        self._repaint_pending = False
+        scene = self.scene()
+        if scene is not None:
+            scene.update(self._dirty_rect)
+        self._dirty_rect = QRectF()
 
     def hoverEnterEvent(self, event):
         # lighten the color fill of the rectangle
         self.highlight()
         self.hovered = True
+        self._update_cache_mode()
+        self._refresh_tooltip()
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
         self.unhighlight()
-        self.setCursor(Qt.CursorShape.ArrowCursor)
+        # the cursor and z value are usually already back to normal, don't reset them
+        if self.cursor().shape() != Qt.CursorShape.ArrowCursor:
+            self.setCursor(Qt.CursorShape.ArrowCursor)
         self.hovered = False
         self.hover_left_edge = False
         self.hover_right_edge = False
-        self.setZValue(10)
+        self._update_cache_mode()
+        if not self.pressed and self.zValue() != 10:
+            self.setZValue(10)
         super().hoverLeaveEvent(event)
 
     def hoverMoveEvent(self, event: QGraphicsSceneHoverEvent | None) -> None:
-        # get our size, if its we're smaller than 10 pixels, determine which edge we're closest to
-        if self.rect().width() < 10:
-            if event.pos().x() <= self.rect().width() / 2:
-                self.setCursor(Qt.CursorShape.SizeHorCursor)
-                self.hover_left_edge = True
-                self.hover_right_edge = False
-                self.update()
-            elif event.pos().x() >= self.rect().width() / 2:
-                self.setCursor(Qt.CursorShape.SizeHorCursor)
-                self.hover_left_edge = False
-                self.hover_right_edge = True
-                self.update()
-
-        elif (
-            event.pos().x() <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-            and not event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-        ):
-            self.setCursor(Qt.CursorShape.SizeHorCursor)
-            self.hover_left_edge = True
-            self.hover_right_edge = False
-            self.update()
-        elif (
-            event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-            and not event.pos().x()
-            <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-        ):
-            self.setCursor(Qt.CursorShape.SizeHorCursor)
-            self.hover_right_edge = True
-            self.hover_left_edge = False
-            self.update()
-        else:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.hover_left_edge = False
-            self.hover_right_edge = False
+        self._refresh_tooltip()
+        x = event.pos().x()
+        # fast path: we're in the interior and weren't on an edge, nothing changes
+        if not (self.hover_left_edge or self.hover_right_edge):
+            w = self.rect().width()
+            b = self._edge_grab_width
+            if w >= 10 and b < x < w - b:
+                return super().hoverMoveEvent(event)
+        edge = self._edge_under(x)
+        hover_left, hover_right = edge == -1, edge == 1
+        # only touch the cursor and repaint when the hovered edge actually changes
+        if (hover_left, hover_right) != (self.hover_left_edge, self.hover_right_edge):
+            self.hover_left_edge = hover_left
+            self.hover_right_edge = hover_right
+            if hover_left or hover_right:
+                cursor = Qt.CursorShape.SizeHorCursor
+            else:
+                cursor = Qt.CursorShape.ArrowCursor
+            if self.cursor().shape() != cursor:
+                self.setCursor(cursor)
             self.update()
         return super().hoverMoveEvent(event)
 
@@ -435,42 +473,30 @@ class OnsetOffsetItem(QGraphicsRectItem):
         option: QStyleOptionGraphicsItem,
         widget: QWidget | None = None,
     ) -> None:
-        painter.setPen(Qt.GlobalColor.transparent)
-        painter.setBrush(QBrush(self.base_color))
-        painter.drawRect(self.rect())
-        edge_color = self.highlight_color.lighter(150)
+        r = self.rect()
+        painter.setPen(self._no_pen)
+        painter.setBrush(self._base_brush)
+        painter.drawRect(r)
         if self.isSelected():
-            pen = QPen(Qt.GlobalColor.lightGray, 2)
-            painter.setPen(pen)
-            painter.drawRect(self.rect())
+            painter.setPen(self._select_pen)
+            painter.drawRect(r)
+        # most items aren't hovered, skip all of the edge decoration for them
         if self.hovered or self.hover_left_edge or self.hover_right_edge:
-            pen = QPen(Qt.GlobalColor.lightGray, 3)
-            painter.setPen(pen)
-            painter.drawRect(self.rect())
-        if self.hover_left_edge:
-            pen = QPen(edge_color, 3)
-            painter.setPen(pen)
-            painter.setBrush(QBrush(edge_color))
-            painter.drawLine(
-                int(self.rect().left()) + 1,
-                2,
-                int(self.rect().left()) - 1,
-                int(self.rect().height()) - 2,
-            )
-        elif self.hover_right_edge:
-            pen = QPen(edge_color, 3)
-            painter.setPen(pen)
-            painter.setBrush(QBrush(edge_color))
-            painter.drawLine(
-                int(self.rect().width()),
-                2,
-                int(self.rect().width()),
-                int(self.rect().height()) - 2,
-            )
+            painter.setPen(self._hover_pen)
+            painter.drawRect(r)
+            if self.hover_left_edge or self.hover_right_edge:
+                painter.setPen(self._edge_pen)
+                painter.setBrush(self._edge_brush)
+                bottom = int(r.height()) - 2
+                if self.hover_left_edge:
+                    left = int(r.left())
+                    painter.drawLine(left + 1, 2, left - 1, bottom)
+                else:
+                    right = int(r.width())
+                    painter.drawLine(right, 2, right, bottom)
         if self.unsure:
-            pen = QPen(Qt.GlobalColor.yellow, 3)
-            painter.setPen(pen)
-            painter.drawRect(self.rect())
+            painter.setPen(self._unsure_pen)
+            painter.drawRect(r)
 
     def save(self):
         return {
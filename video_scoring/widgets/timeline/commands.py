@@ -1,5 +1,7 @@
 from typing import TYPE_CHECKING, List
 
+from qtpy.QtCore import QRectF
+
 from video_scoring.command_stack import Command
 
 if TYPE_CHECKING:
@@ -23,15 +25,13 @@ class AddBehaviorCommand(Command):
         self.item = item
 
     def redo(self):
-        self.track.behavior_items[self.item.onset] = self.item
+        self.track.insert_item(self.item)
         self.timeline_view.scene().addItem(self.item)
-        self.timeline_view.scene().update()
         self.timeline_view.main_window.timestamps_dw.refresh()
 
     def undo(self):
-        self.track.behavior_items.pop(self.item.onset)
+        self.track.pop_item(self.item.onset)
         self.timeline_view.scene().removeItem(self.item)
-        self.timeline_view.scene().update()
         self.timeline_view.main_window.timestamps_dw.refresh()
 
 
@@ -65,12 +65,10 @@ class OnsetOffsetMoveCommand(Command):
     def undo(self):
         self.item.set_onset_offset(self.undo_onset, self.undo_offset)
         self.item.update()
-        self.item.scene().update()
 
     def redo(self):
         self.item.set_onset_offset(self.redo_onset, self.redo_offset)
         self.item.update()
-        self.item.scene().update()
 
 
 class DeleteBehaviorCommand(Command):
@@ -86,15 +84,13 @@ class DeleteBehaviorCommand(Command):
         self.item = item
 
     def undo(self):
-        self.track.behavior_items[self.item.onset] = self.item
+        self.track.insert_item(self.item)
         self.timeline_view.scene().addItem(self.item)
-        self.timeline_view.scene().update()
         self.timeline_view.main_window.timestamps_dw.refresh()
 
     def redo(self):
-        self.track.behavior_items.pop(self.item.onset)
+        self.track.pop_item(self.item.onset)
         self.timeline_view.scene().removeItem(self.item)
-        self.timeline_view.scene().update()
         self.timeline_view.main_window.timestamps_dw.refresh()
 
 
@@ -109,19 +105,26 @@ class BatchDeleteBehaviorCommand(Command):
         self.items = items
 
     def undo(self):
+        scene = self.timeline_view.scene()
+        dirty = QRectF()
         for item in self.items:
             track = item.parent
-            track.behavior_items[item.onset] = item
-            self.timeline_view.scene().addItem(item)
-        self.timeline_view.scene().update()
+            track.insert_item(item)
+            scene.addItem(item)
+            dirty = dirty.united(item.sceneBoundingRect())
+        # one repaint of the affected area and one dock refresh for the whole batch
+        scene.update(dirty)
         self.timeline_view.main_window.timestamps_dw.refresh()
 
     def redo(self):
+        scene = self.timeline_view.scene()
+        dirty = QRectF()
         for item in self.items:
             track = item.parent
-            track.behavior_items.pop(item.onset)
-            self.timeline_view.scene().removeItem(item)
-        self.timeline_view.scene().update()
+            track.pop_item(item.onset)
+            dirty = dirty.united(item.sceneBoundingRect())
+            scene.removeItem(item)
+        scene.update(dirty)
         self.timeline_view.main_window.timestamps_dw.refresh()
 
 
@@ -138,14 +141,15 @@ class AddTrackCommand(Command):
     def redo(self):
         self.timeline_view.behavior_tracks.append(self.track)
         self.timeline_view.scene().addItem(self.track)
-        self.timeline_view.scene().update()
+        self.timeline_view.scene().update(self.track.sceneBoundingRect())
 
     def undo(self):
         self.timeline_view.behavior_tracks.pop(
             self.timeline_view.behavior_tracks.index(self.track)
         )
+        dirty = self.track.sceneBoundingRect()
         self.timeline_view.scene().removeItem(self.track)
-        self.timeline_view.scene().update()
+        self.timeline_view.scene().update(dirty)
 
 
 class DeleteTrackCommand(Command):
@@ -162,16 +166,17 @@ class DeleteTrackCommand(Command):
         self.timeline_view.behavior_tracks.pop(
             self.timeline_view.behavior_tracks.index(self.track)
         )
+        dirty = self.track.sceneBoundingRect()
         self.timeline_view.scene().removeItem(self.track)
         self.timeline_view._parent.track_header.remove_track_header(self.track)
-        self.timeline_view.scene().update()
+        self.timeline_view.scene().update(dirty)
 
     def undo(self):
         self.timeline_view.behavior_tracks.append(self.track)
         self.timeline_view.scene().addItem(self.track)
         self.timeline_view._parent.track_header.add_track_header(self.track)
         # reset the y position of the tracks
-        self.timeline_view.scene().update()
+        self.timeline_view.scene().update(self.track.sceneBoundingRect())
 
 
 class MarkerMoveCommand(Command):
@@ -205,10 +210,8 @@ class MarkerMoveCommand(Command):
         self.item.set_onset_offset(self.undo_onset, self.undo_offset)
         self.item.update()
         self.item.signals.updated.emit()
-        self.item.scene().update()
 
     def redo(self):
         self.item.set_onset_offset(self.redo_onset, self.redo_offset)
         self.item.update()
         self.item.signals.updated.emit()
-        self.item.scene().update()
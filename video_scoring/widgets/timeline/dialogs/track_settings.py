@@ -1,4 +1,3 @@
-import dis
 import logging
 from typing import TYPE_CHECKING, Literal, Optional
 
@@ -84,7 +83,9 @@ class TrackSettingsDialog(QtWidgets.QDialog):
         color = QtWidgets.QColorDialog.getColor(
             QtGui.QColor(self.track.item_color), self
         )
-        if color.isValid():
+        # each setStyleSheet call repolishes the button, so skip it when the
+        # color didn't change
+        if color.isValid() and color.name() != self.track.item_color:
             self.track.update_item_colors(color.name())
             self.item_color_picker.setStyleSheet(
                 f"background-color: {self.track.item_color}"
@@ -96,7 +97,8 @@ class TrackSettingsDialog(QtWidgets.QDialog):
             return
         try:
             self.track.update_shortcut(key_sequence)
-            self.shortcut_edit.setStyleSheet("")
+            if self.shortcut_edit.styleSheet():
+                self.shortcut_edit.setStyleSheet("")
         except Exception as e:
             # notify the user that the shortcut is already taken
             self._parent.timeline.main_window.update_status(
@@ -111,7 +113,8 @@ class TrackSettingsDialog(QtWidgets.QDialog):
             return
         try:
             self.track.update_unsure_shortcut(key_sequence)
-            self.unsure_shortcut_edit.setStyleSheet("")
+            if self.unsure_shortcut_edit.styleSheet():
+                self.unsure_shortcut_edit.setStyleSheet("")
         except Exception as e:
             # notify the user that the shortcut is already taken
             self._parent.timeline.main_window.update_status(
@@ -1,7 +1,7 @@
 from cProfile import label
 from typing import TYPE_CHECKING
 
-from qtpy.QtCore import QObject, QPointF, QRectF, Qt, QTimer, Signal
+from qtpy.QtCore import QObject, QRectF, Qt, QTimer, Signal
 from qtpy.QtGui import QBrush, QColor, QMouseEvent, QPainter, QPen
 from qtpy.QtWidgets import (QGraphicsItem, QGraphicsRectItem,
                             QGraphicsSceneHoverEvent, QGraphicsSceneMouseEvent,
@@ -30,6 +30,12 @@ class MarkerItem(QGraphicsRectItem):
     Represents a marker on the timeline that has an onset and offset
     """
 
+    # pens and brushes that don't depend on the marker color, shared by all markers
+    _edge_pen = QPen(QColor("#0059ff"), 3)
+    _edge_hover_pen = QPen(QColor("#ff0000"), 3)
+    _overlay_brush = QBrush(QColor("#ffffff"))
+    _error_brush = QBrush(QColor("#ff0000"))
+
     def __init__(
         self,
         onset: int,
@@ -50,6 +56,8 @@ class MarkerItem(QGraphicsRectItem):
 
         self.pressed = False
         self.last_mouse_pos = None
+        self._press_onset = onset
+        self._press_offset = offset
         self.left_edge_grabbed = False
         self.right_edge_grabbed = False
         self.hovered = False
@@ -57,16 +65,24 @@ class MarkerItem(QGraphicsRectItem):
         self.hover_right_edge = False
         self.edge_grab_boundary = 8
         self.extend_edge_grab_boundary = 8
+        # total width of each edge's grab zone, used for hit-testing on every hover
+        self._edge_grab_width = self.edge_grab_boundary + self.extend_edge_grab_boundary
+        # kept in sync by setRect so the hover/press hit-tests don't query the rect
+        self._cached_width = 0.0
+        self._right_threshold = -self._edge_grab_width
+        # our rect padded for the bracket lines, which are drawn just outside it
+        self._bounding_rect = QRectF()
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsMovable, True)
         self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemIsSelectable, False)
-        self.setFlag(QGraphicsItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
-        self.setCacheMode(QGraphicsItem.CacheMode.NoCache)
+        self.setCacheMode(QGraphicsItem.CacheMode.DeviceCoordinateCache)
         self.setAcceptHoverEvents(True)
         self.setOpacity(0.1)
         # set geometry
         self.base_color = QColor("#6b86b3")
-        self.setBrush(QBrush(self.base_color))
         self.highlight_color = self.base_color.lighter(120)
+        self._base_brush = QBrush(self.base_color)
+        self._highlight_brush = QBrush(self.highlight_color)
+        self.setBrush(self._base_brush)
 
     # TODO: is there a reason we don't use the built in setters/getters? Fix this if not
     @property
@@ -83,6 +99,21 @@ class MarkerItem(QGraphicsRectItem):
         """
         return self._offset
 
+    def setRect(self, *args) -> None:
+        # the ruler sets our rect on every repaint, usually to the one we already
+        # have, so skip refreshing the caches when nothing changed
+        if QRectF(*args) == self.rect():
+            return
+        super().setRect(*args)
+        self._cached_width = w = self.rect().width()
+        self._right_threshold = w - self._edge_grab_width
+        self._bounding_rect = super().boundingRect().adjusted(-3, 0, 3, 0)
+
+    def boundingRect(self) -> QRectF:
+        # the device cache only keeps what's inside this, so it has to include the
+        # bracket lines
+        return self._bounding_rect
+
     def get_context_menu(self) -> QMenu:
         """
         Returns a context menu for the behavior item
@@ -107,110 +138,66 @@ class MarkerItem(QGraphicsRectItem):
     def update_tooltip(self):
         self.setToolTip(f"Marker In: {self.onset} - Out: {self.offset}")
 
-    def _drag_left_edge(self, event: QGraphicsSceneMouseEvent) -> None:
-        scene_x: QPointF = self.mapToScene(
-            QPointF(event.pos()) - self.last_mouse_pos
-        ).x()
-        nearest_frame = self.ruler_view.get_frame_of_x_pos(scene_x)
+    def _drag_left_edge(self, event: QGraphicsSceneMouseEvent) -> bool:
+        scene_x = event.scenePos().x() - self.last_mouse_pos.x()
+        snapped_x, n_onset = self.ruler_view.snap_scene_x(scene_x)
+        # still within the same frame column, nothing to move or repaint
+        if n_onset == self._onset:
+            return False
         # Ensure the onset is not before the beginning of the video
         if scene_x < 0:
-            return
+            return False
 
         # Ensure onset frame does not exceed offset frame
-        if nearest_frame >= self.offset:
-            return
-        # Get the x position of the nearest frame in local coordinates (by subtracting the current x position)
-        snapped_x_local = (
-            round(scene_x / self.ruler_view.frame_width) * self.ruler_view.frame_width
-        ) - self.pos().x()
-        new_width = self.rect().right() - snapped_x_local  # Calculate the new width
-
-        # save the old position
-        old_x_local = self.rect().left()
-        old_width = self.rect().width()
-
-        # Set the new position and size of the rectangle, and update the n_onset frame
-        self.setRect(
-            snapped_x_local, self.rect().top(), new_width, self.rect().height()
-        )
-        n_onset = self.ruler_view.get_frame_of_x_pos(
-            self.mapToScene(self.rect().left(), 0).x()
-        )
-
         if not self.check_validity(onset=n_onset):
-            self.setRect(
-                old_x_local, self.rect().top(), old_width, self.rect().height()
-            )
-        # otherwise, update the behavior
-        else:
-            self.set_onset(new_onset=n_onset)
-
-    def _drag_right_edge(self, event: QGraphicsSceneMouseEvent) -> None:
-        new_width = (
-            round(
-                # get the x position of the mouse in the scene, but don't let it exceed the right edge of the scene
-                min(
-                    self.mapToScene(QPointF(event.pos())).x(),
-                    self.ruler_view.sceneRect().right(),
-                )
-                # Snap the x position to the nearest frame by dividing by the frame width,
-                # rounding to the nearest frame, then multiplying by the frame width
-                / self.ruler_view.frame_width
-            )
-            * self.ruler_view.frame_width
-            # subtract the current x position to convert to local x position
-            - self.pos().x()
-        )
-
-        # Finally, subtract the left edge of the rectangle to get the new width in local coordinates
-        -self.rect().left()
-
-        if new_width < 1:
-            return
+            return False
+        r = self.rect()
+        # Get the x position of the nearest frame in local coordinates (by subtracting the current x position)
+        snapped_x_local = snapped_x - self.pos().x()
+        new_width = r.right() - snapped_x_local  # Calculate the new width
 
-        old_width = self.rect().width()
+        # Set the new position and size of the rectangle, and update the behavior
+        self.setRect(snapped_x_local, r.top(), new_width, r.height())
+        self.set_onset_offset(n_onset, self._offset)
+        return True
 
-        self.setRect(
-            self.rect().left(), self.rect().top(), new_width, self.rect().height()
-        )
-        n_offset = (
-            int(self.mapToScene(QPointF(event.pos())).x() / self.ruler_view.frame_width)
-            + 1
+    def _drag_right_edge(self, event: QGraphicsSceneMouseEvent) -> bool:
+        # get the x position of the mouse in the scene, but don't let it exceed the
+        # right edge of the scene, and snap it to the nearest frame
+        snapped_x, n_offset = self.ruler_view.snap_scene_x(
+            min(event.scenePos().x(), self.ruler_view.sceneRect().right())
         )
+        # still within the same frame column, nothing to move or repaint
+        if n_offset == self._offset:
+            return False
+        r = self.rect()
+        # subtract the current x position to convert to local x position, then the
+        # left edge of the rectangle to get the new width in local coordinates
+        new_width = snapped_x - self.pos().x() - r.left()
 
+        if new_width < 1:
+            return False
         if not self.check_validity(offset=n_offset):
-            self.setRect(
-                self.rect().left(), self.rect().top(), old_width, self.rect().height()
-            )
-        else:
-            self.set_offset(new_offset=n_offset)
-
-    def _drag_item(self, event: QGraphicsSceneMouseEvent) -> None:
-        scene_x: QPointF = self.mapToScene(
-            QPointF(event.pos()) - self.last_mouse_pos
-        ).x()
-        new_x = self.ruler_view.get_x_pos_of_frame(
-            self.ruler_view.get_frame_of_x_pos(scene_x)
-        )
-
-        if new_x < 0:
-            new_x = 0
-
-        old_x = self.pos().x()
+            return False
+        self.setRect(r.left(), r.top(), new_width, r.height())
+        self.set_onset_offset(self._onset, n_offset)
+        return True
 
-        self.setPos(new_x, self.pos().y())
-        n_onset = self.ruler_view.get_frame_of_x_pos(
-            self.mapToScene(self.rect().left(), 0).x()
-        )
-        n_offset = self.ruler_view.get_frame_of_x_pos(
-            self.mapToScene(self.rect().right(), 0).x()
-        )
+    def _drag_item(self, event: QGraphicsSceneMouseEvent) -> bool:
+        scene_x = event.scenePos().x() - self.last_mouse_pos.x()
+        n_onset = self.ruler_view.get_frame_of_x_pos(scene_x)
+        if n_onset < 0:
+            n_onset = 0
+        # the length doesn't change, so the offset follows from the onset
+        n_offset = n_onset + self._offset - self._onset
+        if n_onset == self._onset:
+            return False
 
         if not self.check_validity(onset=n_onset, offset=n_offset):
-            self.setPos(old_x, self.pos().y())
-        else:
-            self.set_onset(new_onset=n_onset)
-            self.set_offset(new_offset=n_offset)
+            return False
+        self.setPos(self.ruler_view.get_x_pos_of_frame(n_onset), self.pos().y())
+        self.set_onset_offset(n_onset, n_offset)
+        return True
 
     def check_validity(self, onset: int = None, offset: int = None) -> bool:
         """
@@ -229,51 +216,45 @@ class MarkerItem(QGraphicsRectItem):
             True if the onset and offset are valid, False otherwise
         """
         if onset is None:
-            onset = self.onset
+            onset = self._onset
         if offset is None:
-            offset = self.offset
-        if onset < 0:
-            return False
-        if offset > self.timeline_view.num_frames:
-            return False
-        if onset >= offset:
-            return False
-        return True
+            offset = self._offset
+        return 0 <= onset < offset <= self.timeline_view.num_frames
 
     def set_onset(self, new_onset: int):
         """
-        Set the onset of the behavior item. This will manage syncing the onset with the parent track
+        Set the onset of the behavior item. This will manage syncing the onset with the parent track.
+        This doesn't repaint, the caller updates the area it changed.
 
         Parameters
         ----------
         new_onset : int
             The new onset value
         """
-        if not self.check_validity(onset=new_onset, offset=self.offset):
+        offset = self._offset
+        if not self.check_validity(onset=new_onset, offset=offset):
             if self.check_validity(
                 onset=new_onset, offset=self.timeline_view.num_frames
             ):
-                self.set_offset(self.timeline_view.num_frames)
-        self._onset = new_onset
-        self.update_tooltip()
-        self.ruler_view.scene().update()
+                offset = self.timeline_view.num_frames
+        self.set_onset_offset(new_onset, offset)
 
     def set_offset(self, new_offset: int):
         """
-        Set the offset of the behavior item.
+        Set the offset of the behavior item. This doesn't repaint, the caller updates
+        the area it changed.
 
         Parameters
         ----------
         new_offset : int
             The new offset value
         """
-        self._offset = new_offset
-        self.update_tooltip()
-        self.ruler_view.scene().update()
+        self.set_onset_offset(self._onset, new_offset)
 
     def set_onset_offset(self, new_onset: int, new_offset: int):
         """
-        Set the onset and offset of the behavior item.
+        Set the onset and offset of the behavior item. The values aren't validated,
+        this is what `set_onset` and `set_offset` use once they have checked them.
 
         Parameters
         ----------
@@ -282,23 +263,46 @@ class MarkerItem(QGraphicsRectItem):
         new_offset : int
             The new offset value
         """
-        self.set_onset(new_onset)
-        self.set_offset(new_offset)
+        self._onset = new_onset
+        self._offset = new_offset
+        self.update_tooltip()
 
     def highlight(self):
-        self.setBrush(QBrush(self.highlight_color))
+        self.setBrush(self._highlight_brush)
 
     def unhighlight(self):
-        self.setBrush(QBrush(self.base_color))
+        self.setBrush(self._base_brush)
 
     def errorHighlight(self):
-        self.setBrush(QBrush(QColor("#ff0000")))
+        self.setBrush(self._error_brush)
 
     def setErrored(self):
         # will set the error highlight for a short time
         self.errorHighlight()
         QTimer.singleShot(300, self.unhighlight)
 
+    def _edge_under(self, x: float) -> int:
+        """
+        Returns which edge the local x position is over: -1 for the left edge, 1 for
+        the right edge and 0 for the middle of the marker.
+        """
+        w = self._cached_width
+        # if we're smaller than 10 pixels, the closest edge wins
+        if w < 10:
+            return -1 if x <= w * 0.5 else 1
+        # when both grab zones overlap (narrow markers) the shared middle is neither
+        return (x >= self._right_threshold) - (x <= self._edge_grab_width)
+
+    def _update_cache_mode(self):
+        # while hovered or pressed we repaint on nearly every event, so the device
+        # cache would be re-rasterized each time. only cache the idle marker.
+        if self.hovered or self.pressed:
+            mode = QGraphicsItem.CacheMode.NoCache
+        else:
+            mode = QGraphicsItem.CacheMode.DeviceCoordinateCache
+        if self.cacheMode() != mode:
+            self.setCacheMode(mode)
+
     def mousePressEvent(self, event):
         # Handle mouse press events
         if self.hover_left_edge:
@@ -306,138 +310,95 @@ class MarkerItem(QGraphicsRectItem):
         # if we're in the right edge grab boundary
         elif self.hover_right_edge:
             self.pressed = True
-        self.setSelected(True)
+        if self.pressed:
+            # while dragging, be on top of everything except the playhead
+            self.setZValue(999)
+        self._update_cache_mode()
+        if not self.isSelected():
+            self.setSelected(True)
         self.last_mouse_pos = event.pos()
-        cur_onset = self.onset
-        cur_offset = self.offset
-        self.cur_move_command = MarkerMoveCommand(
-            cur_onset, cur_offset, cur_onset, cur_offset, self
-        )
-        # if its we're smaller than 10 pixels, determine which edge we're closest to by dividing the width by 2
-        if self.rect().width() < 10:
-            if event.pos().x() <= self.rect().width() / 2:
-                self.left_edge_grabbed = True
-                self.hover_left_edge = True
-                self.right_edge_grabbed = False
-                self.hover_right_edge = False
-            else:
-                self.left_edge_grabbed = False
-                self.hover_left_edge = False
-                self.right_edge_grabbed = True
-                self.hover_right_edge = True
-        elif (
-            event.pos().x() <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-            and not event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-        ):
-            self.left_edge_grabbed = True
-            self.hover_left_edge = True
-            self.right_edge_grabbed = False
-            self.hover_right_edge = False
-        elif (
-            event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-            and not event.pos().x()
-            <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-        ):
-            self.left_edge_grabbed = False
-            self.hover_left_edge = False
-            self.right_edge_grabbed = True
-            self.hover_right_edge = True
-        else:
-            self.left_edge_grabbed = False
-            self.hover_left_edge = False
-            self.right_edge_grabbed = False
-            self.hover_right_edge = False
-        self.update()
+        # the move command is only built on release, and only if we actually moved
+        self._press_onset = self._onset
+        self._press_offset = self._offset
+        prev_hover = (self.hover_left_edge, self.hover_right_edge)
+        edge = self._edge_under(event.pos().x())
+        self.left_edge_grabbed = self.hover_left_edge = edge == -1
+        self.right_edge_grabbed = self.hover_right_edge = edge == 1
+        # the grab flags aren't painted, only repaint if the highlighted edge changed
+        if (self.hover_left_edge, self.hover_right_edge) != prev_hover:
+            self.update()
         super().mousePressEvent(event)
 
     def mouseReleaseEvent(self, event):
         self.pressed = False
-        if (
-            self.cur_move_command.undo_onset != self.onset
-            or self.cur_move_command.undo_offset != self.offset
-        ):
-            self.cur_move_command.redo_onset = self.onset
-            self.cur_move_command.redo_offset = self.offset
+        self._update_cache_mode()
+        self.setZValue(10)
+        if self._press_onset != self._onset or self._press_offset != self._offset:
             self.signals.updated.emit()
-            self.timeline_view.parent.main_win.command_stack.add_command(
-                self.cur_move_command
+            self.main_win.command_stack.add_command(
+                MarkerMoveCommand(
+                    self._press_onset,
+                    self._press_offset,
+                    self._onset,
+                    self._offset,
+                    self,
+                )
             )
         super().mouseReleaseEvent(event)
 
     def mouseMoveEvent(self, event):
+        moved = False
+        old_rect = self.sceneBoundingRect()
         if self.pressed:
-            # set our z value to be on top of everything except the playhead
-            self.setZValue(999)
             if self.left_edge_grabbed:
-                self._drag_left_edge(event)
+                moved = self._drag_left_edge(event)
             elif self.right_edge_grabbed:
-                self._drag_right_edge(event)
-
-        self.setZValue(10)
-        self.scene().update()
+                moved = self._drag_right_edge(event)
+        # only repaint when the snapped frame changed, and only where we were/are
+        if moved:
+            # padded for the bracket lines, which are drawn just outside our rect
+            self.scene().update(
+                old_rect.united(self.sceneBoundingRect()).adjusted(-3, -3, 3, 3)
+            )
 
     def hoverEnterEvent(self, event):
         # lighten the color fill of the rectangle
         # self.highlight()
         self.hovered = True
+        self._update_cache_mode()
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
         # self.unhighlight()
-        self.setCursor(Qt.CursorShape.ArrowCursor)
-        # self.hovered = False
-        self.hover_left_edge = False
-        self.hover_right_edge = False
+        if self.cursor().shape() != Qt.CursorShape.ArrowCursor:
+            self.setCursor(Qt.CursorShape.ArrowCursor)
+        self.hovered = False
+        if self.hover_left_edge or self.hover_right_edge:
+            # repaint so the highlighted bracket doesn't stick around
+            self.hover_left_edge = False
+            self.hover_right_edge = False
+            self.update()
+        self._update_cache_mode()
         # self.setZValue(10)
         super().hoverLeaveEvent(event)
 
     def hoverMoveEvent(self, event: QGraphicsSceneHoverEvent | None) -> None:
-        # get our size, if its we're smaller than 10 pixels, determine which edge we're closest to
-        if self.rect().width() < 10:
-            if event.pos().x() <= self.rect().width() / 2:
-                self.setCursor(Qt.CursorShape.SizeHorCursor)
-                self.hover_left_edge = True
-                self.hover_right_edge = False
-                self.update()
-            elif event.pos().x() >= self.rect().width() / 2:
-                self.setCursor(Qt.CursorShape.SizeHorCursor)
-                self.hover_left_edge = False
-                self.hover_right_edge = True
-                self.update()
-
-        elif (
-            event.pos().x() <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-            and not event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-        ):
-            self.setCursor(Qt.CursorShape.SizeHorCursor)
-            self.hover_left_edge = True
-            self.hover_right_edge = False
-            self.update()
-        elif (
-            event.pos().x()
-            >= self.rect().width()
-            - self.edge_grab_boundary
-            - self.extend_edge_grab_boundary
-            and not event.pos().x()
-            <= self.edge_grab_boundary + self.extend_edge_grab_boundary
-        ):
-            self.setCursor(Qt.CursorShape.SizeHorCursor)
-            self.hover_right_edge = True
-            self.hover_left_edge = False
-            self.update()
-        else:
-            self.setCursor(Qt.CursorShape.ArrowCursor)
-            self.hover_left_edge = False
-            self.hover_right_edge = False
+        # while the playhead is being scrubbed across us the edges can't be grabbed,
+        # so don't spend every mouse move on cursor changes and repaints
+        if self.ruler_view.lmb_holding:
+            return super().hoverMoveEvent(event)
+        edge = self._edge_under(event.pos().x())
+        hover_left, hover_right = edge == -1, edge == 1
+        # only touch the cursor and repaint when the hovered edge actually changes
+        if (hover_left, hover_right) != (self.hover_left_edge, self.hover_right_edge):
+            self.hover_left_edge = hover_left
+            self.hover_right_edge = hover_right
+            if edge:
+                cursor = Qt.CursorShape.SizeHorCursor
+            else:
+                cursor = Qt.CursorShape.ArrowCursor
+            if self.cursor().shape() != cursor:
+                self.setCursor(cursor)
             self.update()
         return super().hoverMoveEvent(event)
 
@@ -449,38 +410,24 @@ class MarkerItem(QGraphicsRectItem):
     ) -> None:
         # make a light gray pen with rounded edges
         super().paint(painter, option, widget)
-        left_edge_color = QColor("#0059ff")
-        right_edge_color = QColor("#0059ff")
-        if self.hover_left_edge:
-            left_edge_color = QColor("#ff0000")
-        elif self.hover_right_edge:
-            right_edge_color = QColor("#ff0000")
+        r = self.rect()
+        w = self._cached_width
+        bottom = int(r.height() - 2)
         # draw open bracket icon
+        edge_pen, hover_pen = self._edge_pen, self._edge_hover_pen
         painter.setOpacity(0.4)
-        pen = QPen(left_edge_color, 3)
-        painter.setPen(pen)
-        painter.drawLine(
-            int(self.rect().left()) + 1,
-            2,
-            int(self.rect().left()) - 1,
-            int(self.rect().height() - 2),
-        )
-
-        pen = QPen(right_edge_color, 3)
-        painter.setPen(pen)
-        painter.drawLine(
-            int(self.rect().width()),
-            2,
-            int(self.rect().width()),
-            int(self.rect().height() - 2),
-        )
-        # draw a rectangle with an opacity of 0.1
+        painter.setPen(hover_pen if self.hover_left_edge else edge_pen)
+        left = int(r.left())
+        painter.drawLine(left + 1, 2, left - 1, bottom)
+
+        painter.setPen(hover_pen if self.hover_right_edge else edge_pen)
+        painter.drawLine(int(w), 2, int(w), bottom)
+        # draw a rectangle with an opacity of 0.1, anything past our rect would be
+        # clipped by the bounding rect anyway
         painter.setOpacity(0.1)
-        painter.setBrush(QBrush(QColor("#ffffff")))
+        painter.setBrush(self._overlay_brush)
         painter.setPen(Qt.NoPen)
-        painter.drawRect(
-            QRectF(0, 0, self.rect().width(), self.timeline_view.height() - 1),
-        )
+        painter.drawRect(r)
 
     def save(self):
         return {
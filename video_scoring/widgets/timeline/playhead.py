@@ -3,7 +3,7 @@ from typing import TYPE_CHECKING
 from PyQt6.QtGui import QPainter
 from PyQt6.QtWidgets import QStyleOptionGraphicsItem, QWidget
 from qtpy.QtCore import QObject, QPointF, Qt, Signal
-from qtpy.QtGui import QBrush, QColor, QPen, QPolygonF
+from qtpy.QtGui import QBrush, QColor, QPainterPath, QPen, QPolygonF
 from qtpy.QtWidgets import (QGraphicsItem, QGraphicsLineItem,
                             QGraphicsPolygonItem)
 
@@ -34,11 +34,16 @@ class DraggableTriangle(QGraphicsPolygonItem):
         self.base_color = QColor("#6aa1f5")
         self.hovered_color = QColor("#a7c8f2")
         self.active_behavior_color = QColor("#f56a6a")
-        self.setBrush(QBrush(self.base_color))
+        self._base_brush = QBrush(self.base_color)
+        self._hovered_brush = QBrush(self.hovered_color)
+        self._active_behavior_brush = QBrush(self.active_behavior_color)
+        self.setBrush(self._base_brush)
         self.setFlag(QGraphicsLineItem.GraphicsItemFlag.ItemIsSelectable, False)
         self.setFlag(QGraphicsLineItem.GraphicsItemFlag.ItemIsMovable, False)
         self.setAcceptHoverEvents(True)
-        self.setFlag(QGraphicsLineItem.GraphicsItemFlag.ItemSendsGeometryChanges, True)
+        # the polygon and pen never change, so build the stroked shape used for
+        # hit-testing once instead of on every mouse move
+        self._shape = super().shape()
         self._current_frame = 0
         self.pressed = False
 
@@ -50,18 +55,21 @@ class DraggableTriangle(QGraphicsPolygonItem):
     def current_frame(self, value):
         self._current_frame = value
 
+    def shape(self) -> QPainterPath:
+        return self._shape
+
     def mousePressEvent(self, event):
         self.pressed = True
         super().mousePressEvent(event)
 
     def hoverEnterEvent(self, event):
         # lighten the color of the playhead
-        self.setBrush(QBrush(self.hovered_color))
+        self.setBrush(self._hovered_brush)
         super().hoverEnterEvent(event)
 
     def hoverLeaveEvent(self, event):
         # restore the color of the playhead
-        self.setBrush(QBrush(self.base_color))
+        self.setBrush(self._base_brush)
         super().hoverLeaveEvent(event)
 
     def mouseReleaseEvent(self, event):
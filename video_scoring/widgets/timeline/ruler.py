@@ -1,12 +1,14 @@
 import datetime
+import functools
 import math
 from email.charset import QP
 from typing import TYPE_CHECKING, List, Optional, Tuple
 
+import numpy as np
 from PyQt6.QtGui import QMouseEvent, QPaintEvent
 from qtpy import QtCore, QtGui, QtWidgets
 from qtpy.QtCore import QLineF, QMarginsF, QPointF, QRect, QRectF, Qt
-from qtpy.QtGui import QBrush, QColor, QPainter, QPen, QPolygonF
+from qtpy.QtGui import QColor, QPainter, QPen, QPolygonF
 
 from video_scoring.widgets.timeline.marker import MarkerItem
 from video_scoring.widgets.timeline.playhead import Playhead
@@ -15,6 +17,23 @@ if TYPE_CHECKING:
     from video_scoring.widgets.timeline.timeline import TimelineView
 
 
+# the labels only depend on the frame and fps, and the same major ticks are drawn on
+# every ruler repaint while scrolling/zooming, so keep the recent ones around
+@functools.lru_cache(maxsize=4096)
+def _format_frame_time(frame: int, fps: float) -> str:
+    seconds = frame / fps
+    # convert seconds to a datetime object
+    datetime_object = datetime.datetime(1, 1, 1) + datetime.timedelta(seconds=seconds)
+    # if we're in the hours format to HH:MM:SS
+    if seconds >= 3600:
+        return datetime_object.strftime("%H:%M:%S")
+    # if we're in the minutes format to MM:SS
+    elif seconds >= 60:
+        return datetime_object.strftime("%M:%S")
+    # if we're in the seconds format to seconds:milliseconds but only show 3 decimal places
+    return datetime_object.strftime("%S.%f")[:-4]
+
+
 class TimelineRulerView(QtWidgets.QGraphicsView):
     """
     The ruler view is a QGraphicsView that displays the ruler for the timeline.
@@ -22,6 +41,11 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
     view.
     """
 
+    # shared pens, the ticks are redrawn on every repaint and the hover line follows
+    # the mouse
+    _tick_pen = QPen(Qt.GlobalColor.gray, 1)
+    _hover_pen = QPen(Qt.GlobalColor.lightGray, 0.3)
+
     def __init__(self, view: "TimelineView"):
         super().__init__(view)
         self._timeline_view = view
@@ -39,16 +63,25 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
         self._timeline_view.scrolled.connect(self.scroll_changed)
         self.base_frame_width = 50
         self.frame_width = 50
+        # snapping multiplies by this instead of dividing by the frame width
+        self._frame_width_inv = 1.0 / self.frame_width
         self.lmb_holding = False
         self.tick_size = 25
         self.tick_bottom = self.height()
         self.tick_top = self.tick_bottom - self.tick_size
         self.dragging_playhead = False
+        # used to size the time labels, refreshed in changeEvent if the font changes
+        self._font_metrics = QtGui.QFontMetricsF(self.font())
         self._init_playhead()
         self._init_hover_line()
         self._init_marker()
         self._timeline_view.scene_rect_changed.connect(self.update_scene_rect)
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        if event.type() == QtCore.QEvent.Type.FontChange:
+            self._font_metrics = QtGui.QFontMetricsF(self.font())
+        super().changeEvent(event)
+
     def show_context_menu(self, pos):
         item = self.itemAt(pos)
         if isinstance(item, MarkerItem):
@@ -70,6 +103,7 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
 
     def _init_hover_line(self):
         self.hover_line = QtWidgets.QGraphicsLineItem(0, 0, 0, 0)
+        self.hover_line.setPen(self._hover_pen)
         self.scene().addItem(self.hover_line)
         self.hover_line.hide()
 
@@ -78,26 +112,33 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
         self.marker.setVisible(False)
         self.scene().addItem(self.marker)
 
-    def get_visible_frames_with_x(self, dynamic_interval):
+    def get_visible_frames_with_x(
+        self, dynamic_interval
+    ) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Calculate and return a generator of tuples with frame numbers and their corresponding x positions.
+        Calculate the visible tick frames and their corresponding x positions.
+
+        Parameters
+        ----------
+        dynamic_interval : int
+            The interval in frames between major ticks.
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray]
+            The sorted frame numbers of every major and minor tick in view and the
+            x position of each.
         """
         l, r = self._timeline_view.get_visable_frames()
-        frame_index = max(0, l - l % dynamic_interval)
-        major_tick_start = l - l % dynamic_interval
-        minor_tick_start = l - l % self.inter_tick_skip_factor
-        while frame_index <= r:
-            x = int(frame_index * self.frame_width)
-            yield (frame_index, x)
-            # Increment to the next relevant frame index
-            next_major_tick = major_tick_start + dynamic_interval
-            next_minor_tick = minor_tick_start + self.inter_tick_skip_factor
-            frame_index = min(next_major_tick, next_minor_tick)
-            # Update start values for major and minor ticks
-            if frame_index == next_major_tick:
-                major_tick_start = frame_index
-            if frame_index == next_minor_tick:
-                minor_tick_start = frame_index
+        # the major ticks start at or just before the left edge, the minor ticks
+        # from the first one after it
+        major = np.arange(l - l % dynamic_interval, r + 1, dynamic_interval)
+        minor_step = self.inter_tick_skip_factor
+        minor = np.arange(l - l % minor_step + minor_step, r + 1, minor_step)
+        frames = np.union1d(major, minor)
+        frames = frames[frames >= 0]
+        x = (frames * self.frame_width).astype(np.int64)
+        return frames, x
 
     def get_dynamic_interval(self, visible_frames):
         total_visible_frames = visible_frames[1] - visible_frames[0]
@@ -118,10 +159,7 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
         """
         Draws the background of a timeline, including ticks for frames or time.
         """
-        pen = QPen(
-            Qt.GlobalColor.gray, 1
-        )  # Set the pen color and width for the drawing
-        painter.setPen(pen)
+        painter.setPen(self._tick_pen)
         # Determine skip factors for major and minor ticks
         self.skip_factor = max(1, int(self.base_frame_width / self.frame_width))
         self.inter_tick_skip_factor = max(
@@ -133,84 +171,74 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
                 self._timeline_view.visible_right_frame,
             )
         )
-        frames_gen = self.get_visible_frames_with_x(dynamic_interval)
-        for frame_index, x in frames_gen:
-            # Draw a unique tick for the first frame
-            if frame_index == 1:
-                painter.drawLine(x, self.tick_top + 5, x, self.tick_bottom - 5)
-            if self._timeline_view.show_time:
-                self.draw_time_ticks(painter, frame_index, dynamic_interval, x)
-            else:
-                self.draw_frame_ticks(painter, frame_index, dynamic_interval, x)
-
-        frames_gen.close()
+        # collect the tick lines and draw them with one drawLines call each, rather
+        # than a drawLine per tick
+        tick_top, tick_bottom = self.tick_top, self.tick_bottom
+        minor_top, minor_bottom = tick_top + 5, tick_bottom - 5
+        frames, xs = self.get_visible_frames_with_x(dynamic_interval)
+        # every visible frame is a major or a minor tick by construction, so
+        # split them with one vectorised modulus instead of testing each tick
+        is_major = frames % dynamic_interval == 0
+        major_x = xs[is_major].tolist()
+        minor_lines = [
+            QLineF(x, minor_top, x, minor_bottom) for x in xs[~is_major].tolist()
+        ]
+        major_lines = [QLineF(x, tick_top, x, tick_bottom) for x in major_x]
+        labels: List[Tuple[int, int]] = list(zip(frames[is_major].tolist(), major_x))
+        painter.drawLines(minor_lines)
+        painter.drawLines(major_lines)
+
+        if self._timeline_view.show_time:
+            for frame_index, x in labels:
+                self.draw_time_label(painter, frame_index, x)
+        else:
+            for frame_index, x in labels:
+                self.draw_frame_label(painter, frame_index, x)
         super().drawBackground(painter, rect)
 
-    def get_time_from_frame(self, frame: int) -> float:
-        seconds = (
-            frame
-            / self._timeline_view.main_window.video_player_dw.video_widget.play_worker.vc.video.fps
+    def get_time_from_frame(self, frame: int) -> str:
+        fps = (
+            self._timeline_view.main_window.video_player_dw.video_widget.play_worker.vc.video.fps
         )
-        # convert seconds to a datetime object
-        datetime_object = datetime.datetime(1, 1, 1) + datetime.timedelta(
-            seconds=seconds
+        return _format_frame_time(frame, fps)
+
+    def draw_frame_label(self, painter: QPainter, frame_index, x):
+        # label a major tick with its frame number
+        painter.drawText(
+            QRectF(x - 20, self.tick_top - 20, 40, 20),
+            Qt.AlignmentFlag.AlignCenter,
+            str(frame_index),
+        )
+
+    def draw_time_label(self, painter: QPainter, frame_index, x):
+        # label a major tick with its time in the video
+        text = self.get_time_from_frame(frame_index)
+        # get the width of the text, padded by the 4px per side margin a
+        # QTextDocument would add so the labels sit where they always have
+        text_width = self._font_metrics.horizontalAdvance(text) + 8
+        # draw the text
+        painter.drawText(
+            QRectF(x - 20, self.tick_top - 20, text_width, 20),
+            Qt.AlignmentFlag.AlignCenter,
+            text,
         )
-        # if we're in the hours format to HH:MM:SS
-        if seconds >= 3600:
-            datetime_object = datetime_object.strftime("%H:%M:%S")
-        # if we're in the minutes format to MM:SS
-        elif seconds >= 60:
-            datetime_object = datetime_object.strftime("%M:%S")
-        # if we're in the seconds format to seconds:milliseconds but only show 3 decimal places
-        else:
-            datetime_object = datetime_object.strftime("%S.%f")[:-4]
-        return datetime_object
-
-    def draw_frame_ticks(self, painter: QPainter, frame_index, dynamic_interval, x):
-        if frame_index % dynamic_interval == 0:
-            # Draw major tick for frames
-            painter.drawLine(x, self.tick_top, x, self.tick_bottom)
-            painter.drawText(
-                QRectF(x - 20, self.tick_top - 20, 40, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                str(frame_index),
-            )
-        elif frame_index % self.inter_tick_skip_factor == 0:
-            # Draw minor tick for frames
-            painter.drawLine(x, self.tick_top + 5, x, self.tick_bottom - 5)
-
-    def draw_time_ticks(self, painter: QPainter, frame_index, dynamic_interval, x):
-        if frame_index % dynamic_interval == 0:
-            # Draw major tick for whole subdivisions of time
-            painter.drawLine(x, self.tick_top, x, self.tick_bottom)
-            # determine length of text to draw
-            text = self.get_time_from_frame(frame_index)
-            # create text object
-            text_obj = QtGui.QTextDocument()
-            # set the text
-            text_obj.setHtml(text)
-            # get the width of the text
-            text_width = text_obj.size().width()
-            # draw the text
-            painter.drawText(
-                QRectF(x - 20, self.tick_top - 20, text_width, 20),
-                Qt.AlignmentFlag.AlignCenter,
-                text,
-            )
-        elif frame_index % self.inter_tick_skip_factor == 0:
-            # Draw minor tick
-            painter.drawLine(x, self.tick_top + 5, x, self.tick_bottom - 5)
 
     def frame_width_changed(self, width: float):
         self.frame_width = width
+        self._frame_width_inv = 1.0 / width
         self.update()
 
     def get_x_pos_of_frame(self, frame: int) -> int:
         return round(frame * self.frame_width)
 
     def get_frame_of_x_pos(self, x_pos: float) -> int:
-        snapped_x = round(x_pos / self.frame_width) * self.frame_width
-        return round(snapped_x / self.frame_width)
+        # round half up to the nearest frame
+        return math.floor(x_pos * self._frame_width_inv + 0.5)
+
+    def snap_scene_x(self, scene_x: float) -> tuple[float, int]:
+        # snap a scene x position to the nearest frame, returns (snapped x, frame)
+        frame = math.floor(scene_x * self._frame_width_inv + 0.5)
+        return frame * self.frame_width, frame
 
     def move_playhead_to_frame(self, frame: int):
         self.playhead.setPos(self.get_x_pos_of_frame(frame), 0)
@@ -221,19 +249,15 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
         )
         if track is not None:
             self._timeline_view.move_curr_behavior_item(track=track, offset=frame)
+            triangle = self.playhead.triangle
             if track.curr_behavior_item is not None:
-                self.playhead.triangle.setBrush(
-                    QBrush(self.playhead.triangle.active_behavior_color)
-                )
+                triangle.setBrush(triangle._active_behavior_brush)
             else:
-                self.playhead.triangle.setBrush(
-                    QBrush(self.playhead.triangle.base_color)
-                )
+                triangle.setBrush(triangle._base_brush)
         self.scene().update()
 
     def move_playhead_to_x(self, x: int):
-        snapped_x = round(x / self.frame_width) * self.frame_width
-        self.move_playhead_to_frame(round(snapped_x / self.frame_width))
+        self.move_playhead_to_frame(self.get_frame_of_x_pos(x))
 
     def set_marker_in(self, frame: int):
         if not self.marker.isVisible():
@@ -251,8 +275,6 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
 
     def set_hover_line(self, frame: int):
         self.hover_line.show()
-        pen = QPen(Qt.GlobalColor.lightGray, 0.3)
-        self.hover_line.setPen(pen)
         self.hover_line.setLine(
             self.get_x_pos_of_frame(frame),
             self.mapToScene(0, 0).y(),
@@ -262,9 +284,7 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
 
     def set_hover_line_from_x(self, x: int):
         self.hover_line.show()
-        pen = QPen(Qt.GlobalColor.lightGray, 0.3)
-        self.hover_line.setPen(pen)
-        snapped_x = round(x / self.frame_width) * self.frame_width
+        snapped_x = self.snap_scene_x(x)[0]
         self.hover_line.setLine(
             snapped_x,
             self.mapToScene(0, 0).y(),
@@ -337,16 +357,10 @@ class TimelineRulerView(QtWidgets.QGraphicsView):
                 self.move_playhead_to_frame(frame)
                 self.playhead.triangle.pressed = False
 
-        self.scene().update()
+        # the hover line and playhead repaint their own old and new areas, the view's
+        # default minimal viewport updates only need to redraw those
         super().mouseMoveEvent(event)
 
-    def mouseReleaseEvent(self, event):
-        self.scene().update()
-        self.lmb_holding = False
-        self.dragging_playhead = False
-        self.marker.pressed = False
-        super().mouseReleaseEvent(event)
-
     def wheelEvent(self, event: QtGui.QWheelEvent) -> None:
         self._timeline_view.wheelEvent(event)
         self.update()
@@ -1,4 +1,5 @@
 import logging
+import math
 from typing import TYPE_CHECKING, List, Union
 
 from cv2 import resize
@@ -61,6 +62,8 @@ class TimelineView(QGraphicsView):
         if type(value) != float:
             raise TypeError("Frame width must be an integer")
         self._frame_width = value
+        # snapping runs on every drag event, multiply by the inverse instead of dividing
+        self._frame_width_inv = 1.0 / value
         # update the step size of the scroll bar
         self.setSceneRect(0, 0, self.num_frames * self.frame_width, self.height())
         self.scene_rect_changed.emit(self.sceneRect())
@@ -103,6 +106,7 @@ class TimelineView(QGraphicsView):
         self.visible_right_frame = 0
         self._num_frames = 1  # Total number of frames in the timeline
         self._frame_width = self.base_frame_width  # Current width for each frame
+        self._frame_width_inv = 1.0 / self._frame_width
         self._zoom_factor = 1.1  # Factor for zooming in and out
         self.playing = False  # Whether the mouse wheel is being used
         self.lmb_holding = False  # Whether the left mouse button is being held
@@ -241,9 +245,9 @@ class TimelineView(QGraphicsView):
     def get_item_at_frame(self, frame: int):
         # get the item at a specific frame
         for track in self.behavior_tracks:
-            for onset, item in track.behavior_items.items():
-                if frame >= onset and frame <= item.offset:
-                    return item
+            item = track.get_item_at_frame(frame)
+            if item is not None:
+                return item
         return None
 
     def set_length(self, length: int):
@@ -266,23 +270,27 @@ class TimelineView(QGraphicsView):
 
     def get_playline_frame(self):
         # get the current frame the playline is on
-        return round(self.playline.pos().x() / self.frame_width)
+        return math.floor(self.playline.pos().x() * self._frame_width_inv + 0.5)
 
     def get_x_pos_of_frame(self, frame: int) -> int:
         # given a frame, get the x position of that frame in the scene
         return round(frame * self.frame_width)
 
     def get_frame_of_x_pos(self, x_pos: float) -> int:
-        # get the frame of a position
-        snapped_x = round(x_pos / self.frame_width) * self.frame_width
-        return round(snapped_x / self.frame_width)
+        # get the frame of a position, halves always round up so positions snap the
+        # same way on both sides of a frame (round() would alternate on .5)
+        return math.floor(x_pos * self._frame_width_inv + 0.5)
+
+    def snap_scene_x(self, scene_x: float) -> tuple[float, int]:
+        # snap a scene x position to the nearest frame, returns (snapped x, frame)
+        frame = math.floor(scene_x * self._frame_width_inv + 0.5)
+        return frame * self._frame_width, frame
 
     def get_visable_frames(self):
         # returns a tuple of the left and right visible frames
-        left = int(self.mapToScene(0, 0).x() / self.frame_width)
-        right = int(
-            (self.mapToScene(self.rect().width(), 0).x() / self.frame_width) + 1
-        )
+        fw_inv = self._frame_width_inv
+        left = int(self.mapToScene(0, 0).x() * fw_inv)
+        right = int(self.mapToScene(self.rect().width(), 0).x() * fw_inv + 1)
         return left, right
 
     def move_curr_behavior_item(self, track: "BehaviorTrack", offset: int):
@@ -403,17 +411,12 @@ class TimelineView(QGraphicsView):
             )
             ################################ LOD RENDERING ################################
 
-            # get the list of items whos onset and item.offset fall outside the visible range
-            self.item_keys_to_hide[track] = [
-                key
-                for key in track.behavior_items.keys()
-                if key < self.visible_left_frame or key > self.visible_right_frame
-            ]
-            self.item_keys_to_render[track] = [
-                key
-                for key in track.behavior_items.keys()
-                if key >= self.visible_left_frame and key <= self.visible_right_frame
-            ]
+            # split the items by whether their onset falls in the visible range, the
+            # track keeps its onsets sorted so this is a bisect rather than a scan
+            (
+                self.item_keys_to_render[track],
+                self.item_keys_to_hide[track],
+            ) = track.onsets_in_range(self.visible_left_frame, self.visible_right_frame)
             for item in track.behavior_items.values():
                 if not item.pressed:
                     item.setPos(
@@ -655,51 +658,20 @@ class TimelineDockWidget(QDockWidget):
 
     def move_to_last_onset_offset(self):
         curr_frame = self.timeline_view.get_playline_frame()
-        # get all onset and offset frames for the current track to save on
-        onset_offsets = [
-            (item.offset, item.onset)
-            for item in self.timeline_view.get_track_from_name(
-                self.timeline_view.track_name_to_save_on
-            ).behavior_items.values()
-        ]
-        # sort the onset and offset frames
-        onset_offsets.sort(key=lambda x: x[0])
-        # reverse the list
-        onset_offsets.reverse()
-        # get the last onset or offset from the current frame
-        last_onset_offset = None
-        for onset, offset in onset_offsets:
-            if onset < curr_frame:
-                last_onset_offset = onset
-                break
-            elif offset < curr_frame:
-                last_onset_offset = offset
-                break
+        # get the last onset or offset from the current frame on the track to save on
+        last_onset_offset = self.timeline_view.get_track_from_name(
+            self.timeline_view.track_name_to_save_on
+        ).last_onset_offset(curr_frame)
         # if we found a last onset or offset, move to it
         if last_onset_offset is not None:
             self.timeline_view.move_playline_to_frame(last_onset_offset)
 
     def move_to_next_onset_offset(self):
         curr_frame = self.timeline_view.get_playline_frame()
-        # get all onset and offset frames for the current track to save on
-        onset_offsets = [
-            (item.onset, item.offset)
-            for item in self.timeline_view.get_track_from_name(
-                self.timeline_view.track_name_to_save_on
-            ).behavior_items.values()
-        ]
-        # sort the onset and offset frames
-        onset_offsets.sort(key=lambda x: x[0])
-
-        # get the next onset or offset from the current frame
-        next_onset_offset = None
-        for onset, offset in onset_offsets:
-            if onset > curr_frame:
-                next_onset_offset = onset
-                break
-            elif offset > curr_frame:
-                next_onset_offset = offset
-                break
+        # get the next onset or offset from the current frame on the track to save on
+        next_onset_offset = self.timeline_view.get_track_from_name(
+            self.timeline_view.track_name_to_save_on
+        ).next_onset_offset(curr_frame)
         # if we found a next onset or offset, move to it
         if next_onset_offset is not None:
             self.timeline_view.move_playline_to_frame(next_onset_offset)
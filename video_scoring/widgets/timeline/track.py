@@ -1,4 +1,5 @@
 import re
+from bisect import bisect_left, bisect_right, insort
 from typing import TYPE_CHECKING, Literal, Optional
 from uuid import uuid4
 
@@ -39,12 +40,78 @@ class BehaviorTrack(QGraphicsRectItem):
 
         # a dict of behavior items where the key is the onset frame and the value is the item
         self.behavior_items: dict[int, OnsetOffsetItem] = {}
+        # the onsets of `behavior_items` kept in sorted order so we can bisect them
+        self._onsets: list[int] = []
 
         self.curr_behavior_item: Optional[OnsetOffsetItem] = None
 
     def get_item(self, onset: int) -> Optional[OnsetOffsetItem]:
         return self.behavior_items.get(onset, None)
 
+    def insert_item(self, item: "OnsetOffsetItem"):
+        """Insert a behavior item into `behavior_items`, keeping the onset index sorted."""
+        self.behavior_items[item.onset] = item
+        insort(self._onsets, item.onset)
+
+    def pop_item(self, onset: int) -> OnsetOffsetItem:
+        """Remove and return the behavior item with the given onset from `behavior_items`."""
+        item = self.behavior_items.pop(onset)
+        del self._onsets[bisect_left(self._onsets, onset)]
+        return item
+
+    def sorted_items(self) -> list[OnsetOffsetItem]:
+        """Returns the behavior items ordered by onset, without re-sorting them."""
+        behavior_items = self.behavior_items
+        return [behavior_items[onset] for onset in self._onsets]
+
+    def onsets_in_range(self, start: int, end: int) -> tuple[list[int], list[int]]:
+        """
+        Split the onsets of `behavior_items` by whether they fall in a frame range.
+
+        Parameters
+        ----------
+        start : int
+            The first frame of the range
+        end : int
+            The last frame of the range (inclusive)
+
+        Returns
+        -------
+        tuple[list[int], list[int]]
+            The sorted onsets inside the range, and the sorted onsets outside of it
+        """
+        lo = bisect_left(self._onsets, start)
+        hi = bisect_right(self._onsets, end)
+        return self._onsets[lo:hi], self._onsets[:lo] + self._onsets[hi:]
+
+    def get_item_at_frame(self, frame: int) -> Optional[OnsetOffsetItem]:
+        """Returns the behavior item whose onset and offset contain the frame, if any."""
+        return self._item_containing(frame, None)
+
+    def last_onset_offset(self, frame: int) -> Optional[int]:
+        """
+        Returns the closest onset or offset frame before the given frame, if any.
+        """
+        # the last item starting before the frame, earlier items end before it
+        idx = bisect_left(self._onsets, frame) - 1
+        if idx < 0:
+            return None
+        item = self.behavior_items[self._onsets[idx]]
+        return item.offset if item.offset < frame else item.onset
+
+    def next_onset_offset(self, frame: int) -> Optional[int]:
+        """
+        Returns the closest onset or offset frame after the given frame, if any.
+        """
+        # the last item starting at or before the frame may still end after it,
+        # otherwise the next item's onset is the closest
+        idx = bisect_right(self._onsets, frame) - 1
+        if idx >= 0 and self.behavior_items[self._onsets[idx]].offset > frame:
+            return self.behavior_items[self._onsets[idx]].offset
+        if idx + 1 < len(self._onsets):
+            return self._onsets[idx + 1]
+        return None
+
     def add_behavior(self, onset, unsure=False) -> tuple[bool, OnsetOffsetItem]:
         """Add a new behavior item to the track.
 
@@ -67,12 +134,12 @@ class BehaviorTrack(QGraphicsRectItem):
         self.curr_behavior_item = OnsetOffsetItem(
             onset, onset + 1, unsure, self.parent, self
         )
-        self.behavior_items[onset] = self.curr_behavior_item
+        self.insert_item(self.curr_behavior_item)
         return True, self.curr_behavior_item
 
     def remove_behavior(self, item: "OnsetOffsetItem"):
         # remove the given behavior item
-        item = self.behavior_items.pop(item.onset)
+        item = self.pop_item(item.onset)
         self.parent.scene().removeItem(item)
         return item
 
@@ -84,21 +151,35 @@ class BehaviorTrack(QGraphicsRectItem):
     def check_for_overlap(self, onset, offset=None):
         # check if the provided item overlaps with any existing items
         # if it does, return the item that overlaps
-        for other_onset, other_item in self.behavior_items.items():
-            # skip the item we're checking
-            if other_onset == onset:
-                continue
-            # if our new onset is between the onset and offset of another item, don't update the onset
-            if onset >= other_onset and onset <= other_item.offset:
-                return other_item
-            if offset is not None:
-                # if our new offset is between the onset and offset of another item, don't update the offset
-                if offset >= other_onset and offset <= other_item.offset:
-                    return other_item
-                # if we encompass another item, don't update the onset or offset
-                if onset <= other_onset and offset >= other_item.offset:
-                    return other_item
-        return None
+        if offset is None or offset < onset:
+            # if our new onset (or offset) is between the onset and offset of another
+            # item, don't update the onset (or offset)
+            ovlp = self._item_containing(onset, onset)
+            if ovlp is None and offset is not None:
+                ovlp = self._item_containing(offset, onset)
+            return ovlp
+        # otherwise, any other item that shares a frame with [onset, offset]. items in
+        # a track don't overlap, so the last one starting at or before the offset is
+        # the only one that can reach back to the onset
+        idx = bisect_right(self._onsets, offset) - 1
+        # skip the item we're checking
+        if idx >= 0 and self._onsets[idx] == onset:
+            idx -= 1
+        if idx < 0:
+            return None
+        other_item = self.behavior_items[self._onsets[idx]]
+        return other_item if other_item.offset >= onset else None
+
+    def _item_containing(self, frame: int, skip_onset: Optional[int]):
+        # the item, other than the one starting at `skip_onset`, whose inclusive
+        # [onset, offset] contains the frame
+        idx = bisect_right(self._onsets, frame) - 1
+        if idx >= 0 and self._onsets[idx] == skip_onset:
+            idx -= 1
+        if idx < 0:
+            return None
+        other_item = self.behavior_items[self._onsets[idx]]
+        return other_item if other_item.offset >= frame else None
 
     def overlap_with_item_check(
         self, item: "OnsetOffsetItem", onset: int = None, offset: int = None
@@ -120,31 +201,23 @@ class BehaviorTrack(QGraphicsRectItem):
         bool
             True if the onset or offset overlaps with another item, False otherwise
         """
-        # we're updating the onset
-        if onset is not None and onset != item.onset:
-            # if the new onset is already in the dict
-            if onset in self.behavior_items.keys():
-                return True
-            for other_onset, other_item in self.behavior_items.items():
-                # skip the item we're updating
-                if item == other_item:
-                    continue
-                # if our new onset is between the onset and offset of another item
-                if other_onset <= onset and other_item.offset >= onset + 1:
-                    return True
-        # we're updating the offset
-        if offset is not None and offset != item.offset:
-            for other_onset, other_item in self.behavior_items.items():
-                # skip the item we're updating
-                if other_onset == item.onset:
-                    continue
-                # if our new offset is between the onset and offset of another item
-                if offset - 1 >= other_onset and offset <= other_item.offset:
-                    return True
-                # if we encompass another item, don't update the onset or offset
-                if item.onset <= other_onset and offset >= other_item.offset:
-                    return True
-        return False
+        onset_changed = onset is not None and onset != item.onset
+        offset_changed = offset is not None and offset != item.offset
+        if not onset_changed and not offset_changed:
+            return False
+        if not onset_changed:
+            onset = item.onset
+        if not offset_changed:
+            offset = item.offset
+        # items in a track never overlap, so their offsets are sorted like their
+        # onsets and the only item that can overlap [onset, offset) is the last
+        # one (other than the item we're updating) that starts before the offset
+        idx = bisect_left(self._onsets, offset) - 1
+        if idx >= 0 and self._onsets[idx] == item.onset:
+            idx -= 1
+        if idx < 0:
+            return False
+        return self.behavior_items[self._onsets[idx]].offset > onset
 
     def update_behavior_onset(self, item: "OnsetOffsetItem", onset: int):
         """
@@ -156,7 +229,9 @@ class BehaviorTrack(QGraphicsRectItem):
             The item to update
         """
         if onset != item.onset:
-            self.behavior_items[onset] = self.behavior_items.pop(item.onset)
+            self.pop_item(item.onset)
+            self.behavior_items[onset] = item
+            insort(self._onsets, onset)
 
     def mouseMoveEvent(self, event: QGraphicsSceneMouseEvent | None) -> None:
         return super().mouseMoveEvent(event)
@@ -175,10 +250,9 @@ class BehaviorTrack(QGraphicsRectItem):
     def update_item_colors(self, color_str: str):
         color = QColor(color_str)
         self.item_color = color.name()
+        highlight_color = color.lighter(110)
         for item in self.behavior_items.values():
-            item.base_color = color
-            item.highlight_color = color.lighter(150)
-            item.setBrush(QBrush(color))
+            item.set_colors(color, highlight_color)
 
     def update_shortcut(self, key_sequence: QKeySequence):
         if self.save_ts_ks == key_sequence:
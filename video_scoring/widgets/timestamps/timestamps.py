@@ -117,15 +117,16 @@ class TsWidget(QtWidgets.QWidget):
         if len(self.main_win.timeline_dw.timeline_view.behavior_tracks) == 0:
             return
         # get the track name to save on from the timeline
-        ts_behaviors = self.main_win.timeline_dw.timeline_view.behavior_tracks[
+        # the track keeps its items sorted by onset, so there's nothing to sort here
+        ts_behaviors_sorted = self.main_win.timeline_dw.timeline_view.behavior_tracks[
             self.ts_dw.behavior_track_combo.currentIndex()
-        ].behavior_items
-        ts_behaviors_sorted = dict(sorted(ts_behaviors.items(), key=lambda x: x[0]))
-        tb_onsets = [str(onset) for onset in ts_behaviors_sorted.keys()]
-        tb_offsets = [str(item.offset) for item in ts_behaviors_sorted.values()]
+        ].sorted_items()
+        tb_onsets = {str(item.onset) for item in ts_behaviors_sorted}
+        tb_offsets = {str(item.offset) for item in ts_behaviors_sorted}
         self.table.clearContents()
         self.table.setRowCount(0)
-        for onset, item in ts_behaviors_sorted.items():
+        for item in ts_behaviors_sorted:
+            onset = item.onset
             # add the onset to the table
             self.table.insertRow(self.table.rowCount())
             onset_item = QtWidgets.QTableWidgetItem(str(onset))